@@ -1,120 +1,82 @@
 # app.py
+import time
+
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
+
+from finance_core import (
+    affordability_projection_methods,
+    compute_sdlt,
+    compute_sdlt_batch,
+    gross_to_net,
+    monthly_payment,
+    monthly_payment_vec,
+    salary_projection_methods,
+)
 
 st.set_page_config(page_title="Personal Finance Projection - UK", layout="wide")
 
 # -------------------------
-# Utility: UK TAX + NIC (2025/26)
-# Sources: gov.uk income tax & rates/thresholds, gov.uk SDLT pages (see assistant citations)
+# Session: scenarios
 # -------------------------
-PERSONAL_ALLOWANCE = 12570  # 2025/26
-# Income tax bands (2025/26): basic 20% up to 50,270, higher 40% up to 125,140, additional 45% above.
-TAX_BANDS = [
-    (0, 12570, 0.0),
-    (12570, 50270, 0.20),
-    (50270, 125140, 0.40),
-    (125140, float("inf"), 0.45),
-]
-
-# NIC (Class 1 employee) simplified:
-# Primary threshold: £12,570 per year (no NIC below). 12% between PT and Upper Earnings Limit (UEL).
-# 2% above UEL. Historically UEL aligned with higher rate threshold ~50,270.
-NIC_PT = 12570
-NIC_UEL = 50270
-NIC_RATES = [(NIC_PT, NIC_UEL, 0.12), (NIC_UEL, float("inf"), 0.02)]
+# Union of the columns written by both save paths (Salary Projection / Affordability)
+SCENARIO_SCHEMA = {
+    "mode": "object",
+    "type": "object",
+    "price": "float64",
+    "net_monthly_salary": "float64",
+    "deposit_pct": "Int64",
+    "deposit_amt": "Int64",
+    "term_years": "Int64",
+    "interest_rate": "float64",
+    "monthly_pay": "float64",
+    "gross_needed": "float64",
+    "sdlt": "float64",
+    "price_affordable": "float64",
+    "mortgage_affordable": "float64",
+}
+
+# pandas is imported only once scenarios are used, keeping it off the cold-start path
+if "scenarios_df" not in st.session_state:
+    st.session_state.scenarios_df = None  # built from SCENARIO_SCHEMA on first save
+    st.session_state.scenarios_modified = time.time()
 
-def compute_income_tax(gross):
-    """Return income tax for annual gross (GBP)."""
-    tax = 0.0
-    for low, high, rate in TAX_BANDS:
-        if gross <= low:
-            break
-        taxable = min(gross, high) - low
-        tax += taxable * rate
-        if gross <= high:
-            break
-    return max(0.0, tax)
-
-def compute_nic(gross):
-    """Compute employee NIC (Class 1) for gross annual salary."""
-    nic = 0.0
-    for low, high, rate in NIC_RATES:
-        if gross <= low:
-            continue
-        taxable = min(gross, high) - low
-        nic += taxable * rate
-    return max(0.0, nic)
-
-def gross_to_net(gross):
-    """Return (net_annual, tax, nic) for gross annual salary."""
-    tax = compute_income_tax(gross)
-    nic = compute_nic(gross)
-    net = gross - tax - nic
-    return net, tax, nic
+def save_scenario(s):
+    import pandas as pd
+    df = st.session_state.scenarios_df
+    if df is None:
+        # first save builds a one-row frame with the schema dtypes (missing keys -> NA);
+        # enlarging an empty frame would upcast every column to object
+        st.session_state.scenarios_df = pd.DataFrame(
+            {c: pd.Series([s.get(c)], dtype=t) for c, t in SCENARIO_SCHEMA.items()})
+    else:
+        df.loc[len(df)] = s  # appends in place, keeping each column's dtype
+    st.session_state.scenarios_modified = time.time()
 
-def net_to_gross(target_net, guess_low=0.0, guess_high=1_000_000.0):
+@st.cache_data(max_entries=16)
+def _scenario_table(_df, n_rows, modified_at):
     """
-    Estimate gross that yields approx target_net by binary search.
-    Returns estimated gross, and (net, tax, nic) at that gross.
+    Return (table, prices) for the saved scenarios; rebuilt only when (n_rows, modified_at) changes.
+    prices is each row's price, taken from price_affordable for Affordability rows.
     """
-    low = guess_low
-    high = guess_high
-    for _ in range(60):
-        mid = (low + high) / 2.0
-        net, _, _ = gross_to_net(mid)
-        if net < target_net:
-            low = mid
-        else:
-            high = mid
-    gross = (low + high) / 2.0
-    net, tax, nic = gross_to_net(gross)
-    return gross, net, tax, nic
-
-# -------------------------
-# SDLT (Stamp Duty) for residential properties (slabbed)
-# New zero band: £0-125,000 @0% (from April 2025). Then 2% up to 250k, 5% up to 925k, 10% up to 1.5m, 12% above.
-SDLT_BANDS = [
-    (0, 125000, 0.00),
-    (125000, 250000, 0.02),
-    (250000, 925000, 0.05),
-    (925000, 1500000, 0.10),
-    (1500000, float("inf"), 0.12),
-]
-
-def compute_sdlt(price):
-    tax = 0.0
-    for low, high, rate in SDLT_BANDS:
-        if price <= low:
-            break
-        taxable = min(price, high) - low
-        tax += taxable * rate
-        if price <= high:
-            break
-    return tax
-
-# -------------------------
-# Loan math
-# -------------------------
-def monthly_payment(principal, annual_rate_percent, years):
-    if principal <= 0 or years <= 0:
-        return 0.0
-    r = annual_rate_percent / 100.0 / 12.0
-    n = years * 12
-    if r == 0:
-        return principal / n
-    return principal * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
+    import numpy as np
+    import pandas as pd
+    df = _df.copy()
+    prices = df["price"].combine_first(df["price_affordable"]).fillna(0)
+    # Fill SDLT for House scenarios that didn't store it (Affordability) with one vectorized call
+    sdlt_all = np.where(df["mode"] == "House", compute_sdlt_batch(prices.to_numpy()), 0.0)
+    df["sdlt"] = df["sdlt"].fillna(pd.Series(sdlt_all, index=df.index))
+    return df, prices
 
 # -------------------------
-# Session: scenarios
+# Charts
 # -------------------------
-if "scenarios" not in st.session_state:
-    st.session_state.scenarios = []  # list of dicts
-
-def save_scenario(s):
-    st.session_state.scenarios.append(s)
+@st.cache_resource(max_entries=1024)
+def _pie(values, labels, title):
+    """Build (once per distinct input) the monthly distribution pie chart."""
+    import plotly.graph_objects as go  # unlike plotly.express, doesn't pull in pandas
+    fig = go.Figure(go.Pie(values=values, labels=labels, texttemplate="%{percent:.0%}<br>(£%{value:,.0f})"))
+    fig.update_layout(title=title)
+    return fig
 
 # -------------------------
 # UI Layout
@@ -131,39 +93,41 @@ calc_type = st.radio("Calculation type", ["Salary Projection", "Affordability"],
 col_in, col_out = st.columns([1, 1.2], gap="large")
 
 with col_in:
-    st.markdown("### Inputs")
-    # Common inputs
-    price = st.number_input("Target price (£)", min_value=0, value=300_000, step=1000,
-                            help="Target house/car price used in Salary Projection. In Affordability you'll see max price calculated.")
-    deposit_pct = st.slider("Deposit (%)", 0, 50, 15,
-                            help="Percent of price you'll put down as deposit. You may also set a deposit amount below to override.")
-    deposit_amt = st.number_input("Deposit amount (£) — overrides % if >0", min_value=0, value=0, step=500,
-                                 help="Enter explicit deposit amount to override percent.")
-    term_years = st.slider("Term (years)", 1, 40, 25,
-                           help="Length of mortgage/loan in years.")
-    interest_rate = st.number_input("Interest rate (annual %)", min_value=0.0, value=5.0, step=0.1,
-                                    help="Annual APR used to calculate monthly payments.")
-    arrangement_fee = st.number_input("Arrangement / One-off fees (£)", min_value=0, value=1_500, step=50,
-                                      help="One-off fees such as arrangement/solicitor/conveyancing (for house) or admin (car).")
-    monthly_overheads = st.number_input("Monthly overheads (£)", min_value=0, value=500, step=50,
-                                       help="Regular fixed outgoings (utilities, subscriptions).")
-    monthly_expenses = st.number_input("Other monthly expenses (£)", min_value=0, value=1000, step=50,
-                                       help="Food, transport, childcare, discretionary spend.")
-    lti = st.number_input("Loan-to-Income multiple (LTI)", min_value=1.0, max_value=10.0, value=4.5, step=0.1,
-                          help="Typical lender multiple of gross annual income used for eligibility checks.")
-    # Affordability mode: primary user input is net monthly salary (take-home)
-    net_monthly_salary = st.number_input("Net monthly salary (£) — take-home (Affordability)", min_value=0, value=3000, step=100,
-                                        help="Enter take-home pay to compute how much you can afford. For Salary Projection you can leave this as-is.")
-    effective_tax_rate = st.slider("Quick effective tax rate (%) used for simple estimates (alternative to PAYE calc)", 0, 50, 35,
-                                   help="If you prefer not to use the detailed PAYE/NIC calc, this slider gives a simple gross/net conversion. Leave as-is to use the accurate UK PAYE+NIC calculator.")
-
-    with st.expander("Advanced / UK-specific (Stamp Duty, stress test & insurance)"):
-        show_sdlt = st.checkbox("Include Stamp Duty (SDLT) calc (House only)", value=True)
-        stress_rate_shift = st.number_input("Stress test: increase interest rate by (+%)", value=2.0, step=0.1,
-                                           help="Apply an increase to interest rate to evaluate affordability under stress (e.g., +2%).")
-        maintenance_pct = st.number_input("Maintenance (% of property per year)", min_value=0.0, max_value=5.0, value=1.0, step=0.1,
-                                         help="Estimated annual maintenance cost as % of property value.")
-        insurance_monthly = st.number_input("Estimated insurance / car tax monthly (£)", min_value=0, value=50, step=10)
+    with st.form("finance_inputs"):
+        st.markdown("### Inputs")
+        # Common inputs
+        price = st.number_input("Target price (£)", min_value=0, value=300_000, step=1000,
+                                help="Target house/car price used in Salary Projection. In Affordability you'll see max price calculated.")
+        deposit_pct = st.slider("Deposit (%)", 0, 50, 15,
+                                help="Percent of price you'll put down as deposit. You may also set a deposit amount below to override.")
+        deposit_amt = st.number_input("Deposit amount (£) — overrides % if >0", min_value=0, value=0, step=500,
+                                     help="Enter explicit deposit amount to override percent.")
+        term_years = st.slider("Term (years)", 1, 40, 25,
+                               help="Length of mortgage/loan in years.")
+        interest_rate = st.number_input("Interest rate (annual %)", min_value=0.0, value=5.0, step=0.1,
+                                        help="Annual APR used to calculate monthly payments.")
+        arrangement_fee = st.number_input("Arrangement / One-off fees (£)", min_value=0, value=1_500, step=50,
+                                          help="One-off fees such as arrangement/solicitor/conveyancing (for house) or admin (car).")
+        monthly_overheads = st.number_input("Monthly overheads (£)", min_value=0, value=500, step=50,
+                                           help="Regular fixed outgoings (utilities, subscriptions).")
+        monthly_expenses = st.number_input("Other monthly expenses (£)", min_value=0, value=1000, step=50,
+                                           help="Food, transport, childcare, discretionary spend.")
+        lti = st.number_input("Loan-to-Income multiple (LTI)", min_value=1.0, max_value=10.0, value=4.5, step=0.1,
+                              help="Typical lender multiple of gross annual income used for eligibility checks.")
+        # Affordability mode: primary user input is net monthly salary (take-home)
+        net_monthly_salary = st.number_input("Net monthly salary (£) — take-home (Affordability)", min_value=0, value=3000, step=100,
+                                            help="Enter take-home pay to compute how much you can afford. For Salary Projection you can leave this as-is.")
+        effective_tax_rate = st.slider("Quick effective tax rate (%) used for simple estimates (alternative to PAYE calc)", 0, 50, 35,
+                                       help="If you prefer not to use the detailed PAYE/NIC calc, this slider gives a simple gross/net conversion. Leave as-is to use the accurate UK PAYE+NIC calculator.")
+
+        with st.expander("Advanced / UK-specific (Stamp Duty, stress test & insurance)"):
+            show_sdlt = st.checkbox("Include Stamp Duty (SDLT) calc (House only)", value=True)
+            stress_rate_shift = st.number_input("Stress test: increase interest rate by (+%)", value=2.0, step=0.1,
+                                               help="Apply an increase to interest rate to evaluate affordability under stress (e.g., +2%).")
+            maintenance_pct = st.number_input("Maintenance (% of property per year)", min_value=0.0, max_value=5.0, value=1.0, step=0.1,
+                                             help="Estimated annual maintenance cost as % of property value.")
+            insurance_monthly = st.number_input("Estimated insurance / car tax monthly (£)", min_value=0, value=50, step=10)
+        st.form_submit_button("Recalculate")
 
 # -------------------------
 # Calculations
@@ -191,84 +155,14 @@ if effective_tax_rate > 0 and effective_tax_rate < 100:
 else:
     gross_from_net_simple = net_monthly_salary * 12.0
 
-# accurate PAYE approach: binary search net_to_gross helper
-def required_gross_for_affordability(net_monthly_required):
-    """Given required net monthly, return gross est using full PAYE+NIC calc."""
-    target_net_annual = net_monthly_required * 12.0
-    gross, net, tax, nic = net_to_gross(target_net_annual, guess_high=2_000_000)
-    return gross, net, tax, nic
-
-# Salary Projection: given price & loan, compute required gross (two methods)
-def salary_projection_methods():
-    # 1) LTI method (simple): gross = loan_amount / lti
-    gross_by_lti = loan_amount / lti if lti > 0 else 0.0
-
-    # 2) Affordability method: required net monthly = monthly_pay + overheads + expenses + maintenance + insurance
-    required_net_monthly = monthly_pay + monthly_overheads + monthly_expenses + monthly_maintenance + insurance_monthly
-    # convert required net monthly to gross using PAYE/NIC accurate method
-    gross_by_afford, net_calc, tax_calc, nic_calc = required_gross_for_affordability(required_net_monthly)
-    # as fallback provide simple gross estimate
-    gross_by_afford_simple = (required_net_monthly * 12.0) / (1.0 - effective_tax_rate / 100.0) if effective_tax_rate < 100 else 0.0
-
-    return {
-        "gross_by_lti": gross_by_lti,
-        "gross_by_afford": gross_by_afford,
-        "gross_by_afford_simple": gross_by_afford_simple,
-        "required_net_monthly": required_net_monthly,
-        "tax_calc": tax_calc,
-        "nic_calc": nic_calc,
-    }
-
-# Affordability Projection: given net salary & expenses compute max mortgage / price
-def affordability_projection_methods():
-    # Use accurate gross from net
-    gross_annual, net_annual, tax_calc, nic_calc = net_to_gross(net_monthly_salary * 12.0, guess_high=2_000_000)[:4]
-    # LTI cap
-    mortgage_by_lti = gross_annual * lti
-    # Affordability cap by payments: available for mortgage = net_monthly_salary - (overheads + expenses + maintenance + insurance)
-    available_for_mortgage_monthly = max(0.0, net_monthly_salary - (monthly_overheads + monthly_expenses + monthly_maintenance + insurance_monthly))
-    # Convert monthly available into a maximum loan by inverting monthly payment formula:
-    # approximate maximum loan if monthly payment = available_for_mortgage_monthly
-    r = interest_rate / 100.0 / 12.0
-    n = term_years * 12
-    if r == 0:
-        mortgage_by_payment = available_for_mortgage_monthly * n
-    else:
-        # principal = payment * (1 - (1+r)^-n) / r
-        mortgage_by_payment = available_for_mortgage_monthly * (1 - (1 + r) ** (-n)) / r
-    # Conservative mortgage is min of LTI and payment-based
-    mortgage_affordable = min(mortgage_by_lti, mortgage_by_payment)
-    # Price = mortgage / (1 - deposit_pct) (if deposit_pct==100 => price == deposit)
-    # To avoid division by 0:
-    denom = (1 - deposit_pct / 100.0) if deposit_amt == 0 else (loan_amount / price if price > 0 else 0.0)
-    # If user provided explicit deposit amount, compute price from mortgage + deposit:
-    if deposit_amt > 0:
-        price_affordable = mortgage_affordable + deposit_amt
-    else:
-        # deposit % path
-        if denom <= 0:
-            price_affordable = mortgage_affordable  # fallback
-        else:
-            price_affordable = mortgage_affordable / (1 - deposit_pct / 100.0)
-    return {
-        "gross_annual": gross_annual,
-        "net_annual": net_annual,
-        "mortgage_by_lti": mortgage_by_lti,
-        "mortgage_by_payment": mortgage_by_payment,
-        "mortgage_affordable": mortgage_affordable,
-        "price_affordable": price_affordable,
-        "available_for_mortgage_monthly": available_for_mortgage_monthly,
-        "tax_calc": tax_calc,
-        "nic_calc": nic_calc,
-    }
-
 # -------------------------
 # Display outputs
 # -------------------------
 with col_out:
     st.markdown("### Results & Charts")
     if calc_type == "Salary Projection":
-        sp = salary_projection_methods()
+        sp = salary_projection_methods(loan_amount, lti, monthly_pay, monthly_overheads, monthly_expenses,
+                                       monthly_maintenance, insurance_monthly, effective_tax_rate)
         gross_needed = max(sp["gross_by_lti"], sp["gross_by_afford"])
         st.metric("Required Gross Annual Salary (conservative)", f"£{gross_needed:,.0f}")
         st.write("**Breakdown**")
@@ -281,14 +175,14 @@ with col_out:
         st.write(f"- Annual maintenance estimate: £{annual_maintenance:,.0f} ({maintenance_pct}% pa)")
         # charts: pie of net monthly distribution assuming net from gross_needed
         gross_est = gross_needed
-        net_est, tax_est, nic_est = gross_to_net(gross_est)
+        if gross_est == sp["gross_by_afford"]:
+            net_est = sp["net_est"]
+        else:  # LTI path wins
+            net_est, _, _ = gross_to_net(gross_est)
         disposable = net_est/12.0 - (monthly_pay + monthly_overheads + monthly_expenses + monthly_maintenance + insurance_monthly)
         labels = ["Mortgage payment", "Overheads + expenses", "Maintenance + insurance", "Disposable"]
         values = [monthly_pay, monthly_overheads + monthly_expenses, monthly_maintenance + insurance_monthly, max(0.0, disposable)]
-        fig, ax = plt.subplots(figsize=(4,3))
-        ax.pie(values, labels=labels, autopct=lambda p: f"{p:.0f}%\n(£{int(p/100*sum(values)):,.0f})", startangle=140)
-        ax.set_title("Monthly net distribution (est)")
-        st.pyplot(fig)
+        st.plotly_chart(_pie(tuple(values), tuple(labels), "Monthly net distribution (est)"))
 
         # Save scenario
         if st.button("Save scenario (Salary Projection)"):
@@ -307,7 +201,9 @@ with col_out:
             st.success("Scenario saved.")
 
     else:  # Affordability
-        ap = affordability_projection_methods()
+        ap = affordability_projection_methods(net_monthly_salary, lti, monthly_overheads, monthly_expenses,
+                                              monthly_maintenance, insurance_monthly, interest_rate, term_years,
+                                              deposit_pct, deposit_amt, loan_amount, price)
         st.metric("Maximum Affordable Price (conservative)", f"£{ap['price_affordable']:,.0f}")
         st.write("**Breakdown**")
         st.write(f"- Max mortgage by LTI: £{ap['mortgage_by_lti']:,.0f}")
@@ -326,10 +222,7 @@ with col_out:
         disposable = net_est/12.0 - (mortgage_monthly + monthly_overheads + monthly_expenses + monthly_maintenance + insurance_monthly)
         labels = ["Mortgage", "Overheads+Expenses", "Maintenance+Insurance", "Disposable"]
         values = [mortgage_monthly, monthly_overheads + monthly_expenses, monthly_maintenance + insurance_monthly, max(0.0, disposable)]
-        fig, ax = plt.subplots(figsize=(4,3))
-        ax.pie(values, labels=labels, autopct=lambda p: f"{p:.0f}%\n(£{int(p/100*sum(values)):,.0f})", startangle=140)
-        ax.set_title("Monthly net distribution (your inputs)")
-        st.pyplot(fig)
+        st.plotly_chart(_pie(tuple(values), tuple(labels), "Monthly net distribution (your inputs)"))
 
         if st.button("Save scenario (Affordability)"):
             save_scenario({
@@ -340,47 +233,52 @@ with col_out:
                 "deposit_amt": deposit_amt,
                 "term_years": term_years,
                 "interest_rate": interest_rate,
+                "monthly_pay": monthly_for_affordable_loan,
                 "price_affordable": ap["price_affordable"],
                 "mortgage_affordable": ap["mortgage_affordable"],
             })
             st.success("Scenario saved.")
 
+    # Sensitivity: monthly payment across a sweep of interest rates, in one vectorized call
+    sweep_principal = loan_amount if calc_type == "Salary Projection" else ap["mortgage_affordable"]
+    if st.checkbox("Show sensitivity: monthly payment vs interest rate"):
+        import numpy as np
+        import pandas as pd
+        sweep_rates = np.linspace(1.0, 15.0, 141)
+        sweep = pd.DataFrame({"Monthly £": monthly_payment_vec(sweep_principal, sweep_rates, term_years)},
+                             index=pd.Index(sweep_rates, name="Interest rate (annual %)"))
+        st.line_chart(sweep, x_label="Interest rate (annual %)", y_label="Monthly payment (£)")
+
 # -------------------------
 # Scenario comparison area
 # -------------------------
 st.markdown("---")
 st.header("Saved Scenarios & Comparison")
-if len(st.session_state.scenarios) == 0:
+if st.session_state.scenarios_df is None:
     st.info("No scenarios saved yet. Use 'Save scenario' to add one and compare multiple scenarios.")
 else:
-    df = pd.DataFrame(st.session_state.scenarios)
+    import pandas as pd
+    df, scenario_prices = _scenario_table(st.session_state.scenarios_df, len(st.session_state.scenarios_df),
+                                          st.session_state.scenarios_modified)
     # Normalize columns for display
     st.dataframe(df.fillna(""), width=1100)
     # Allow selection of scenarios to compare
-    selected = st.multiselect("Select scenarios to compare (by row index)", options=list(range(len(df))), format_func=lambda i: f"{i}: {df.loc[i].get('type','')} - {df.loc[i].get('mode','')} - £{int(df.loc[i].get('price', df.loc[i].get('price_affordable',0))):,}")
+    selected = st.multiselect("Select scenarios to compare (by row index)", options=list(range(len(df))), format_func=lambda i: f"{i}: {df.at[i, 'type']} - {df.at[i, 'mode']} - £{int(scenario_prices[i]):,}")
     if selected:
-        compare_df = df.loc[selected].copy()
+        compare = df.loc[selected]
         st.markdown("### Comparison chart: Price / Gross Needed / Monthly Payment")
-        fig2, ax2 = plt.subplots(figsize=(8,4))
         # try to plot price and gross_needed/mortgage values
-        x = [f"{i}" for i in selected]
-        prices = []
-        gross_needed = []
-        monthlys = []
-        for i in selected:
-            row = df.loc[i]
-            prices.append(row.get("price", row.get("price_affordable", 0)))
-            gross_needed.append(row.get("gross_needed", row.get("gross_annual", 0)))
-            monthlys.append(row.get("monthly_pay", row.get("mortgage_affordable", 0)) )
-        ax2.bar([p + "\nprice" for p in x], prices, label="Price")
-        ax2.bar([p + "\ngross" for p in x], gross_needed, label="Gross needed")
-        ax2.set_ylabel("GBP")
-        ax2.legend()
-        st.pyplot(fig2)
+        plot_df = pd.DataFrame({
+            "Price": scenario_prices.loc[selected],
+            "Gross needed": compare["gross_needed"].fillna(0),
+            "Monthly": compare["monthly_pay"].fillna(0),
+        })
+        plot_df.index = plot_df.index.astype(str)
+        st.bar_chart(plot_df, y_label="GBP", stack=False)
 
 # -------------------------
 # Footer & Sources
 # -------------------------
 st.markdown("---")
 st.caption("**Notes & sources:** This tool uses UK Income Tax bands and NIC rules for 2025/26 (Personal Allowance £12,570; basic 20% up to £50,270; higher 40% up to £125,140; additional 45% above). Employee NIC: primary threshold £12,570; 12% between threshold and upper earnings limit (~£50,270), 2% above. SDLT (Stamp Duty) slabbed rates used for residential properties (0% up to £125k, 2% next band, etc.). These are estimates for guidance only; always check with lenders/official calculators.")
-st.write("If you'd like, I can: (1) add a downloadable PDF report, (2) make the PAYE/NIC toggles explicit (detailed vs simple), (3) add sensitivity sliders to show affordable price vs interest rate graph. Which would you like next?")
+st.write("If you'd like, I can: (1) add a downloadable PDF report, (2) make the PAYE/NIC toggles explicit (detailed vs simple). Which would you like next?")
@@ -0,0 +1,251 @@
+# finance_core.py
+# Pure UK tax / SDLT / loan maths shared by the Streamlit calculator pages.
+import math
+from bisect import bisect_right
+from functools import cache
+from itertools import accumulate
+
+import numpy as np
+
+# -------------------------
+# Utility: UK TAX + NIC (2025/26)
+# Sources: gov.uk income tax & rates/thresholds, gov.uk SDLT pages (see assistant citations)
+# -------------------------
+PERSONAL_ALLOWANCE = 12570  # 2025/26
+# Income tax bands (2025/26): basic 20% up to 50,270, higher 40% up to 125,140, additional 45% above.
+TAX_BANDS = [
+    (0, 12570, 0.0),
+    (12570, 50270, 0.20),
+    (50270, 125140, 0.40),
+    (125140, float("inf"), 0.45),
+]
+
+# NIC (Class 1 employee) simplified:
+# Primary threshold: £12,570 per year (no NIC below). 12% between PT and Upper Earnings Limit (UEL).
+# 2% above UEL. Historically UEL aligned with higher rate threshold ~50,270.
+NIC_PT = 12570
+NIC_UEL = 50270
+NIC_RATES = [(NIC_PT, NIC_UEL, 0.12), (NIC_UEL, float("inf"), 0.02)]
+
+def _band_tables(bands):
+    """
+    Split a sorted [(low, high, rate), ...] band table into (lows, rates, cum) lists,
+    where cum[i] is the total tax due on everything below lows[i].
+    """
+    lows = [float(low) for low, _, _ in bands]
+    rates = [float(rate) for _, _, rate in bands]
+    cum = [0.0, *accumulate((high - low) * rate for low, high, rate in bands[:-1])]
+    return lows, rates, cum
+
+def _band_arrays(bands):
+    """Contiguous float64 (lows, rates, cum) arrays of a band table, for the compiled kernel."""
+    return tuple(np.ascontiguousarray(col, dtype=np.float64) for col in _band_tables(bands))
+
+def _bands_tax(amounts, lows, rates, cum):
+    """Tax due on each of amounts (1-D float64): bisect to its band, then one multiply-add."""
+    idx = np.searchsorted(lows, amounts, side="right") - 1
+    out = np.zeros(amounts.shape[0])
+    for i in range(amounts.shape[0]):
+        k = idx[i]
+        if k >= 0:
+            out[i] = cum[k] + (amounts[i] - lows[k]) * rates[k]
+    return out
+
+@cache
+def _bands_tax_kernel():
+    """_bands_tax compiled with Numba, imported on the first ndarray call to keep it off cold start."""
+    from numba import njit
+    return njit(cache=True)(_bands_tax)
+
+def _table_tax(amount, lows, rates, cum):
+    """Tax due on a scalar amount: bisect to its band, then one multiply-add."""
+    i = bisect_right(lows, amount) - 1
+    if i < 0:
+        return 0.0
+    return cum[i] + (amount - lows[i]) * rates[i]
+
+def _band_tax(amount, table, arrays):
+    """Tax due on amount: scalars use the plain-list table, ndarrays the compiled kernel."""
+    if isinstance(amount, np.ndarray):
+        amount = amount.astype(np.float64, copy=False)
+        return _bands_tax_kernel()(amount.ravel(), *arrays).reshape(amount.shape)
+    return _table_tax(amount, *table)
+
+_TAX_TABLE = _band_tables(TAX_BANDS)
+_NIC_TABLE = _band_tables(NIC_RATES)
+_TAX_ARRAYS = _band_arrays(TAX_BANDS)
+_NIC_ARRAYS = _band_arrays(NIC_RATES)
+
+def compute_income_tax(gross):
+    """Return income tax for annual gross (GBP), scalar or array."""
+    return _band_tax(gross, _TAX_TABLE, _TAX_ARRAYS)
+
+def compute_nic(gross):
+    """Compute employee NIC (Class 1) for gross annual salary, scalar or array."""
+    return _band_tax(gross, _NIC_TABLE, _NIC_ARRAYS)
+
+def gross_to_net(gross):
+    """Return (net_annual, tax, nic) for gross annual salary."""
+    tax = compute_income_tax(gross)
+    nic = compute_nic(gross)
+    net = gross - tax - nic
+    return net, tax, nic
+
+# net_to_gross inverse: income tax + NIC is piecewise linear, so merge both band
+# tables into one list of breakpoints with combined marginal rates and precompute
+# the net value at each breakpoint. Inverting is then one bisect + one division.
+_NET_BANDS = TAX_BANDS + NIC_RATES
+_NET_BPS = sorted({b for low, high, _ in _NET_BANDS for b in (low, high) if b != float("inf")})
+_NET_RATES = [sum(rate for low, high, rate in _NET_BANDS if low <= bp < high) for bp in _NET_BPS]
+_NET_AT_BP = [0.0, *accumulate((hi - lo) * (1 - rate) for lo, hi, rate in zip(_NET_BPS, _NET_BPS[1:], _NET_RATES))]
+
+def net_to_gross(target_net):
+    """
+    Return gross that yields target_net, and (net, tax, nic) at that gross.
+    Net is linear between breakpoints, so the matching segment is solved exactly.
+    """
+    k = bisect_right(_NET_AT_BP, target_net) - 1
+    if k < 0:
+        gross = 0.0
+    else:
+        gross = _NET_BPS[k] + (target_net - _NET_AT_BP[k]) / (1 - _NET_RATES[k])
+    net, tax, nic = gross_to_net(gross)
+    return gross, net, tax, nic
+
+# -------------------------
+# SDLT (Stamp Duty) for residential properties (slabbed)
+# New zero band: £0-125,000 @0% (from April 2025). Then 2% up to 250k, 5% up to 925k, 10% up to 1.5m, 12% above.
+SDLT_BANDS = [
+    (0, 125000, 0.00),
+    (125000, 250000, 0.02),
+    (250000, 925000, 0.05),
+    (925000, 1500000, 0.10),
+    (1500000, float("inf"), 0.12),
+]
+_SDLT_TABLE = _band_tables(SDLT_BANDS)
+# Batch coefficients: each band's lower edge, width and rate as contiguous float64 arrays
+_SDLT_LOW, _SDLT_WIDTH, _SDLT_RATE = (
+    np.ascontiguousarray(col, dtype=np.float64)
+    for col in zip(*((low, high - low, rate) for low, high, rate in SDLT_BANDS))
+)
+
+def compute_sdlt(price):
+    """Return SDLT for a property price (GBP), scalar or array."""
+    if isinstance(price, np.ndarray):
+        return compute_sdlt_batch(price)
+    return _table_tax(price, *_SDLT_TABLE)
+
+def compute_sdlt_batch(prices):
+    """Return SDLT for an array of prices: clip each into every band, then one einsum over rates."""
+    prices = np.asarray(prices, dtype=np.float64)
+    taxable = np.clip(prices[..., None] - _SDLT_LOW, 0.0, _SDLT_WIDTH)
+    return np.einsum("...j,j->...", taxable, _SDLT_RATE)
+
+# -------------------------
+# Loan math
+# -------------------------
+def annuity_factors(r, n):
+    """
+    Return ((1+r)**n - 1, 1 - (1+r)**-n) for the payment and inverse-payment formulas.
+    expm1(n * log1p(r)) avoids the cancellation in (1+r)**n - 1 at small r.
+    """
+    x = n * math.log1p(r)
+    return math.expm1(x), -math.expm1(-x)
+
+def _annuity_payment(principal, r, n):
+    """Level payment repaying principal over n periods at periodic rate r."""
+    if r == 0:
+        return principal / n
+    fwd_m1, _ = annuity_factors(r, n)
+    return principal * r * (fwd_m1 + 1) / fwd_m1
+
+def monthly_payment(principal, annual_rate_percent, years):
+    if principal <= 0 or years <= 0:
+        return 0.0
+    r = annual_rate_percent / 100.0 / 12.0
+    n = years * 12
+    return _annuity_payment(principal, r, n)
+
+def monthly_payment_vec(principal, annual_rates_percent, years):
+    """monthly_payment for one principal over an array of annual rates (%), in one NumPy pass."""
+    r = np.asarray(annual_rates_percent, dtype=np.float64) / 100.0 / 12.0
+    if principal <= 0 or years <= 0:
+        return np.zeros_like(r)
+    n = years * 12
+    # array form of annuity_factors
+    m1 = np.expm1(n * np.log1p(r))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(r == 0, principal / n, principal * r * (m1 + 1) / m1)
+
+# -------------------------
+# Projections
+# -------------------------
+# Salary Projection: given price & loan, compute required gross (two methods)
+def salary_projection_methods(loan_amount, lti, monthly_pay, monthly_overheads, monthly_expenses,
+                              monthly_maintenance, insurance_monthly, effective_tax_rate):
+    # 1) LTI method (simple): gross = loan_amount / lti
+    gross_by_lti = loan_amount / lti if lti > 0 else 0.0
+
+    # 2) Affordability method: required net monthly = monthly_pay + overheads + expenses + maintenance + insurance
+    required_net_monthly = monthly_pay + monthly_overheads + monthly_expenses + monthly_maintenance + insurance_monthly
+    # convert required net monthly to gross using PAYE/NIC accurate method
+    gross_by_afford, net_calc, tax_calc, nic_calc = net_to_gross(required_net_monthly * 12.0)
+    # as fallback provide simple gross estimate
+    gross_by_afford_simple = (required_net_monthly * 12.0) / (1.0 - effective_tax_rate / 100.0) if effective_tax_rate < 100 else 0.0
+
+    return {
+        "gross_by_lti": gross_by_lti,
+        "gross_by_afford": gross_by_afford,
+        "gross_by_afford_simple": gross_by_afford_simple,
+        "required_net_monthly": required_net_monthly,
+        "tax_calc": tax_calc,
+        "nic_calc": nic_calc,
+        # net at gross_by_afford (tax/nic are tax_calc/nic_calc), so callers needn't re-run gross_to_net
+        "net_est": net_calc,
+    }
+
+# Affordability Projection: given net salary & expenses compute max mortgage / price
+def affordability_projection_methods(net_monthly_salary, lti, monthly_overheads, monthly_expenses,
+                                     monthly_maintenance, insurance_monthly, interest_rate, term_years,
+                                     deposit_pct, deposit_amt, loan_amount, price):
+    # Use accurate gross from net
+    gross_annual, net_annual, tax_calc, nic_calc = net_to_gross(net_monthly_salary * 12.0)
+    # LTI cap
+    mortgage_by_lti = gross_annual * lti
+    # Affordability cap by payments: available for mortgage = net_monthly_salary - (overheads + expenses + maintenance + insurance)
+    available_for_mortgage_monthly = max(0.0, net_monthly_salary - (monthly_overheads + monthly_expenses + monthly_maintenance + insurance_monthly))
+    # Convert monthly available into a maximum loan by inverting monthly payment formula:
+    # approximate maximum loan if monthly payment = available_for_mortgage_monthly
+    r = interest_rate / 100.0 / 12.0
+    n = term_years * 12
+    if r == 0:
+        mortgage_by_payment = available_for_mortgage_monthly * n
+    else:
+        # principal = payment * (1 - (1+r)^-n) / r
+        _, inv_m1 = annuity_factors(r, n)
+        mortgage_by_payment = available_for_mortgage_monthly * inv_m1 / r
+    # Conservative mortgage is min of LTI and payment-based
+    mortgage_affordable = min(mortgage_by_lti, mortgage_by_payment)
+    # Price = mortgage / (1 - deposit_pct) (if deposit_pct==100 => price == deposit)
+    # To avoid division by 0:
+    denom = (1 - deposit_pct / 100.0) if deposit_amt == 0 else (loan_amount / price if price > 0 else 0.0)
+    # If user provided explicit deposit amount, compute price from mortgage + deposit:
+    if deposit_amt > 0:
+        price_affordable = mortgage_affordable + deposit_amt
+    else:
+        # deposit % path
+        if denom <= 0:
+            price_affordable = mortgage_affordable  # fallback
+        else:
+            price_affordable = mortgage_affordable / (1 - deposit_pct / 100.0)
+    return {
+        "gross_annual": gross_annual,
+        "net_annual": net_annual,
+        "mortgage_by_lti": mortgage_by_lti,
+        "mortgage_by_payment": mortgage_by_payment,
+        "mortgage_affordable": mortgage_affordable,
+        "price_affordable": price_affordable,
+        "available_for_mortgage_monthly": available_for_mortgage_monthly,
+        "tax_calc": tax_calc,
+        "nic_calc": nic_calc,
+    }